@@ -1,7 +1,7 @@
 // BMW GPX Route Generator - React Native App Structure
 // This shows how to convert your Streamlit app to React Native for iPhone
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import {
   View,
   Text,
@@ -11,22 +11,33 @@ import {
   Alert,
   TextInput,
   Switch,
-  Picker
+  Modal,
+  FlatList,
+  ActivityIndicator,
+  InteractionManager
 } from 'react-native';
 import MapView, { Polyline, Marker } from 'react-native-maps';
 import * as FileSystem from 'expo-file-system';
 import * as Sharing from 'expo-sharing';
 
-// BMW Bike Database (same as your Streamlit app)
-const BMW_BIKES = {
+// Freeze an object and every nested object it holds (Object.freeze is shallow)
+const deepFreeze = (obj) => {
+  for (const value of Object.values(obj)) {
+    if (value && typeof value === 'object') deepFreeze(value);
+  }
+  return Object.freeze(obj);
+};
+
+// BMW Bike Database (same as your Streamlit app); deep-frozen, never mutated
+const BMW_BIKES = deepFreeze({
   "R 1250 GS": {"tank_capacity": 20, "fuel_consumption": 5.5, "comfort_stops": 2.5, "type": "adventure"},
   "R 1250 GS Adventure": {"tank_capacity": 30, "fuel_consumption": 6.0, "comfort_stops": 3.0, "type": "adventure"},
   "R 1250 RT": {"tank_capacity": 25, "fuel_consumption": 5.8, "comfort_stops": 3.5, "type": "touring"},
   // ... rest of your BMW bikes
-};
+});
 
-// Route Templates (same as your Streamlit app)
-const ROUTE_TEMPLATES = {
+// Route Templates (same as your Streamlit app); deep-frozen, never mutated
+const ROUTE_TEMPLATES = deepFreeze({
   "Mountain Twisties": {
     "description": "Challenging mountain roads with tight curves",
     "terrain": "mountain",
@@ -35,7 +46,360 @@ const ROUTE_TEMPLATES = {
     "waypoint_factor": 1.3
   },
   // ... rest of your templates
+});
+
+// Computed once rather than on every render
+const BIKE_NAMES = Object.keys(BMW_BIKES);
+const TEMPLATE_ENTRIES = Object.entries(ROUTE_TEMPLATES);
+
+// Characters that are unsafe in file names (spaces kept out for sharing)
+const UNSAFE_FILENAME_RE = /[ \/\\:*?"<>|]/g;
+
+// XML entity for each character that cannot appear raw in element text
+const XML_ESCAPES = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&apos;'
 };
+const XML_SPECIAL_RE = /[&<>"']/g;
+
+const escapeXml = (text) => text.replace(XML_SPECIAL_RE, c => XML_ESCAPES[c]);
+
+// Value of ` name="..."` inside the tag spanning [from, to), or null
+const readAttribute = (text, name, from, to) => {
+  const key = ` ${name}="`;
+  const keyStart = text.indexOf(key, from);
+  if (keyStart < 0 || keyStart >= to) return null;
+
+  const valueStart = keyStart + key.length;
+  const valueEnd = text.indexOf('"', valueStart);
+  if (valueEnd < 0 || valueEnd >= to) return null;
+
+  return text.slice(valueStart, valueEnd);
+};
+
+// Parse GPX to coordinates for map display.
+// Single forward scan over <trkpt> tags; no regex or match objects per point.
+const parseGPXToCoordinates = (gpxText) => {
+  const coords = [];
+  let pos = gpxText.indexOf('<trkpt');
+
+  while (pos >= 0) {
+    const tagEnd = gpxText.indexOf('>', pos);
+    if (tagEnd < 0) break;
+
+    const lat = readAttribute(gpxText, 'lat', pos, tagEnd);
+    const lon = readAttribute(gpxText, 'lon', pos, tagEnd);
+    // Skip missing or blank attributes (+'' and +' ' are both 0) and drop
+    // values that fail to convert (NaN is the only value not equal to itself)
+    if (lat && lon && lat.trim() && lon.trim()) {
+      const latitude = +lat;
+      const longitude = +lon;
+      if (latitude === latitude && longitude === longitude) {
+        coords.push({ latitude, longitude });
+      }
+    }
+
+    pos = gpxText.indexOf('<trkpt', tagEnd);
+  }
+
+  return coords;
+};
+
+// Per-waypoint-count tables of cos(a), sin(a) and sin(2a) for the template
+// angles a = 2*pi*i/n; numPoints only takes a handful of values
+const TRIG_CACHE = new Map();
+
+const trigTable = (n) => {
+  let table = TRIG_CACHE.get(n);
+  if (!table) {
+    table = {
+      cos: new Float64Array(n),
+      sin: new Float64Array(n),
+      sin2: new Float64Array(n)
+    };
+    // Step the unit vector by 2*pi/n with a rotation recurrence instead of
+    // calling cos/sin per angle; sin(2a) = 2*sin(a)*cos(a)
+    const step = (2 * Math.PI) / n;
+    const cosStep = Math.cos(step);
+    const sinStep = Math.sin(step);
+    let c = 1;
+    let sn = 0;
+    for (let i = 0; i < n; i++) {
+      table.cos[i] = c;
+      table.sin[i] = sn;
+      table.sin2[i] = 2 * sn * c;
+
+      const nextC = c * cosStep - sn * sinStep;
+      sn = sn * cosStep + c * sinStep;
+      c = nextC;
+      // Renormalize periodically to keep rounding drift off the unit circle
+      if ((i & 63) === 63) {
+        const norm = 1 / Math.hypot(c, sn);
+        c *= norm;
+        sn *= norm;
+      }
+    }
+    TRIG_CACHE.set(n, table);
+  }
+  return table;
+};
+
+// Helper function to generate coordinates based on template.
+// Returns parallel lon/lat arrays; the loop start/finish occupies both ends.
+const generateCoordinatesFromTemplate = (start, template, hours) => {
+  const templateConfig = ROUTE_TEMPLATES[template];
+  const radiusKm = hours * 25 * (templateConfig?.scenic_factor || 1.0);
+  const numPoints = Math.floor(8 * (templateConfig?.waypoint_factor || 1.0));
+
+  const lons = new Float64Array(numPoints + 2);
+  const lats = new Float64Array(numPoints + 2);
+  const cosLat = Math.cos(start.latitude * Math.PI / 180);
+  const kLon = 1 / (111 * cosLat);
+  const kLat = 1 / 111;
+  const trig = trigTable(numPoints);
+
+  lons[0] = start.longitude;
+  lats[0] = start.latitude;
+
+  for (let i = 0; i < numPoints; i++) {
+    const radiusVariation = radiusKm * (0.7 + 0.6 * trig.sin2[i]);
+
+    lons[i + 1] = start.longitude + radiusVariation * trig.cos[i] * kLon;
+    lats[i + 1] = start.latitude + radiusVariation * trig.sin[i] * kLat;
+  }
+
+  lons[numPoints + 1] = start.longitude; // Close loop
+  lats[numPoints + 1] = start.latitude;
+  return { lons, lats };
+};
+
+// ORS directions request body. Written straight from the lon/lat arrays as
+// JSON ({"coordinates": [[lon, lat], ...], ...}) instead of building nested
+// arrays for JSON.stringify to walk.
+const buildDirectionsBody = (lons, lats) => {
+  let body = '{"coordinates":[';
+  for (let i = 0; i < lons.length; i++) {
+    if (i > 0) body += ',';
+    body += '[' + lons[i] + ',' + lats[i] + ']';
+  }
+  return body + '],"format":"gpx","instructions":true,"elevation":true}';
+};
+
+// Drop <tag>...</tag> when it is the first child in text; ORS puts its own
+// <name>/<desc> there, ahead of <author>, which may carry a <name> of its own
+const stripLeadingElement = (text, tag) => {
+  const start = text.length - text.trimStart().length;
+  if (!text.startsWith(`<${tag}>`, start)) return text;
+
+  const close = `</${tag}>`;
+  const end = text.indexOf(close, start);
+  if (end < 0) return text;
+
+  return text.slice(0, start) + text.slice(end + close.length);
+};
+
+// First <tag ...> start tag at or after from; `<tag` must be followed by
+// '>', whitespace or '/' so e.g. <gpx> does not match <gpxtpx:...>.
+// Returns { start, end, selfClosing } with end just past the '>', or null.
+const findStartTag = (text, tag, from = 0) => {
+  let start = text.indexOf(`<${tag}`, from);
+  while (start >= 0) {
+    const next = text.charAt(start + tag.length + 1);
+    if (next === '>' || next === '/' || /\s/.test(next)) {
+      const tagEnd = text.indexOf('>', start);
+      if (tagEnd < 0) return null;
+      return {
+        start,
+        end: tagEnd + 1,
+        selfClosing: text.charAt(tagEnd - 1) === '/'
+      };
+    }
+    start = text.indexOf(`<${tag}`, start + 1);
+  }
+  return null;
+};
+
+// Add BMW-specific metadata to GPX. ORS's own metadata children (author,
+// copyright/licence, time, bounds, extensions) are kept: only <name>/<desc>
+// are replaced, and the <bmw> block joins ORS's <extensions>. Without a
+// <metadata> element, one is created right after the <gpx> start tag.
+const addBMWMetadata = (gpxContent, { heading, bmw }) => {
+  const fullMetadata =
+    `\n    <metadata>${heading}\n      <extensions>${bmw}\n      </extensions>\n    </metadata>`;
+
+  const metadata = findStartTag(gpxContent, 'metadata');
+  if (!metadata) {
+    const gpx = findStartTag(gpxContent, 'gpx');
+    if (!gpx || gpx.selfClosing) throw new Error("Response is not a GPX document");
+
+    return gpxContent.slice(0, gpx.end) + fullMetadata + gpxContent.slice(gpx.end);
+  }
+
+  // <metadata/> is an empty element: fill it rather than treat it as unclosed
+  if (metadata.selfClosing) {
+    return gpxContent.slice(0, metadata.start) + fullMetadata +
+      gpxContent.slice(metadata.end);
+  }
+
+  const close = gpxContent.indexOf('</metadata>', metadata.end);
+  if (close < 0) throw new Error("GPX metadata element is not closed");
+
+  // GPX requires <name> and <desc> first and <extensions> last
+  let children = stripLeadingElement(
+    stripLeadingElement(gpxContent.slice(metadata.end, close), 'name'),
+    'desc'
+  );
+  const extensions = findStartTag(children, 'extensions');
+  if (!extensions) {
+    children += `<extensions>${bmw}</extensions>`;
+  } else if (extensions.selfClosing) {
+    children = children.slice(0, extensions.start) +
+      `<extensions>${bmw}</extensions>` + children.slice(extensions.end);
+  } else {
+    const extensionsClose = children.indexOf('</extensions>', extensions.end);
+    if (extensionsClose < 0) throw new Error("GPX extensions element is not closed");
+    children = children.slice(0, extensionsClose) + bmw + children.slice(extensionsClose);
+  }
+
+  // The result is a new full-size string; writeAsStringAsync has no append
+  // mode to stream the pieces instead
+  return gpxContent.slice(0, metadata.end) + heading + children + gpxContent.slice(close);
+};
+
+// Fixed row height lets FlatList place bike rows without measuring them
+const BIKE_ROW_HEIGHT = 44;
+
+const bikeKey = name => name;
+const bikeItemLayout = (_, index) => ({
+  length: BIKE_ROW_HEIGHT,
+  offset: BIKE_ROW_HEIGHT * index,
+  index
+});
+
+const BikeRow = React.memo(({ name, selected, onPress }) => (
+  <TouchableOpacity
+    style={[styles.bikeRow, selected && styles.selectedBikeRow]}
+    onPress={() => onPress(name)}
+  >
+    <Text style={styles.bikeRowText}>{name}</Text>
+  </TouchableOpacity>
+));
+
+// Memoized so only the previously and newly selected buttons re-render
+const TemplateButton = React.memo(({ name, config, selected, onPress }) => (
+  <TouchableOpacity
+    style={[
+      styles.templateButton,
+      selected && styles.selectedTemplate
+    ]}
+    onPress={() => onPress(name)}
+  >
+    <Text style={styles.templateName}>{name}</Text>
+    <Text style={styles.templateDesc}>{config.description}</Text>
+  </TouchableOpacity>
+));
+
+// Douglas-Peucker tolerance for the on-screen polyline, in degrees (~10 m).
+// The saved GPX keeps every trackpoint; only the map draws fewer.
+const DISPLAY_TOLERANCE_DEG = 0.0001;
+
+// Squared distance from p to the segment a-b in lat/lon degrees
+const segmentDistanceSq = (p, a, b) => {
+  const dx = b.longitude - a.longitude;
+  const dy = b.latitude - a.latitude;
+  const lenSq = dx * dx + dy * dy;
+  let t = lenSq > 0
+    ? ((p.longitude - a.longitude) * dx + (p.latitude - a.latitude) * dy) / lenSq
+    : 0;
+  t = Math.max(0, Math.min(1, t));
+
+  const ex = p.longitude - (a.longitude + t * dx);
+  const ey = p.latitude - (a.latitude + t * dy);
+  return ex * ex + ey * ey;
+};
+
+// Iterative Douglas-Peucker simplification of a {latitude, longitude} path
+const simplifyPath = (points, tolerance) => {
+  if (points.length <= 2) return points;
+
+  const toleranceSq = tolerance * tolerance;
+  const keep = new Uint8Array(points.length);
+  keep[0] = keep[points.length - 1] = 1;
+  const stack = [0, points.length - 1];
+
+  while (stack.length > 0) {
+    const last = stack.pop();
+    const first = stack.pop();
+    let maxDistSq = 0;
+    let index = -1;
+
+    for (let i = first + 1; i < last; i++) {
+      const distSq = segmentDistanceSq(points[i], points[first], points[last]);
+      if (distSq > maxDistSq) {
+        maxDistSq = distSq;
+        index = i;
+      }
+    }
+
+    if (maxDistSq > toleranceSq) {
+      keep[index] = 1;
+      stack.push(first, index, index, last);
+    }
+  }
+
+  return points.filter((_, i) => keep[i] === 1);
+};
+
+// Typing in the settings inputs re-renders the app; these memoized
+// subtrees only re-render when their own props change
+const TemplateGrid = React.memo(({ selectedTemplate, onSelect }) => (
+  <View style={styles.templateGrid}>
+    {TEMPLATE_ENTRIES.map(([name, config]) => (
+      <TemplateButton
+        key={name}
+        name={name}
+        config={config}
+        selected={selectedTemplate === name}
+        onPress={onSelect}
+      />
+    ))}
+  </View>
+));
+
+const RouteMap = React.memo(({ startLocation, routeCoordinates, onPress }) => {
+  // Only a new start location should hand MapView a new region object
+  const region = useMemo(() => ({
+    latitude: startLocation.latitude,
+    longitude: startLocation.longitude,
+    latitudeDelta: 0.5,
+    longitudeDelta: 0.5,
+  }), [startLocation]);
+  // Fewer points to send across the bridge; recomputed only for a new route
+  const displayCoordinates = useMemo(
+    () => simplifyPath(routeCoordinates, DISPLAY_TOLERANCE_DEG),
+    [routeCoordinates]
+  );
+
+  return (
+    <MapView
+      style={styles.map}
+      region={region}
+      onPress={onPress}
+    >
+      <Marker coordinate={startLocation} title="Start/Finish" />
+      {displayCoordinates.length > 0 && (
+        <Polyline
+          coordinates={displayCoordinates}
+          strokeColor="#0066CC"
+          strokeWidth={4}
+        />
+      )}
+    </MapView>
+  );
+});
 
 const BMWGPXApp = () => {
   // State management (equivalent to Streamlit session state)
@@ -53,117 +417,107 @@ const BMWGPXApp = () => {
   const [avoidTolls, setAvoidTolls] = useState(false);
   const [avoidHighways, setAvoidHighways] = useState(false);
 
+  const [bikeListVisible, setBikeListVisible] = useState(false);
+  const [isGenerating, setIsGenerating] = useState(false);
+  const inFlight = useRef(false);
+  const openBikeList = useCallback(() => setBikeListVisible(true), []);
+  const closeBikeList = useCallback(() => setBikeListVisible(false), []);
+  const selectBike = useCallback(name => {
+    setSelectedBike(name);
+    setBikeListVisible(false);
+  }, []);
+  const renderBikeRow = useCallback(({ item }) => (
+    <BikeRow
+      name={item}
+      selected={item === selectedBike}
+      onPress={selectBike}
+    />
+  ), [selectedBike, selectBike]);
+  const selectTemplate = useCallback(name => setSelectedTemplate(name), []);
+  // BMW-specific metadata for the GPX file, rebuilt (and escaped) only on
+  // edits: the <name>/<desc> heading and the <bmw> extension block
+  const metadataFragment = useMemo(() => {
+    const bike = escapeXml(selectedBike);
+    return {
+      heading: `
+      <name>${escapeXml(rideName)}</name>
+      <desc>BMW Motorrad route for ${bike}</desc>`,
+      bmw: `
+        <bmw>
+          <bike_model>${bike}</bike_model>
+          <emergency_contact>${escapeXml(emergencyContact)}</emergency_contact>
+          <emergency_phone>${escapeXml(emergencyPhone)}</emergency_phone>
+        </bmw>`
+    };
+  }, [rideName, selectedBike, emergencyContact, emergencyPhone]);
+  const onMapPress = useCallback(
+    e => setStartLocation(e.nativeEvent.coordinate),
+    []
+  );
+
   // Generate route function (calls your API)
-  const generateRoute = async () => {
-    try {
-      const coordinates = generateCoordinatesFromTemplate(
-        startLocation,
-        selectedTemplate,
-        duration
-      );
-
-      const response = await fetch('https://api.openrouteservice.org/v2/directions/driving-car/gpx', {
-        method: 'POST',
-        headers: {
-          'Authorization': 'YOUR_API_KEY', // Store securely
-          'Content-Type': 'application/json'
-        },
-        body: JSON.stringify({
-          coordinates: coordinates,
-          format: 'gpx',
-          instructions: true,
-          elevation: true
-        })
-      });
-
-      const gpxData = await response.text();
-      const routeCoords = parseGPXToCoordinates(gpxData);
-      setRouteCoordinates(routeCoords);
-
-      // Generate and save GPX file
-      await saveGPXFile(gpxData);
-      
-      Alert.alert("Success", "BMW GPX route generated and saved!");
-    } catch (error) {
-      Alert.alert("Error", "Failed to generate route: " + error.message);
-    }
-  };
+  const generateRoute = () => {
+    // A second tap while a route is in flight would repeat the ORS call and
+    // overwrite the same file
+    if (inFlight.current) return;
+    inFlight.current = true;
+    setIsGenerating(true);
 
-  // Helper function to generate coordinates based on template
-  const generateCoordinatesFromTemplate = (start, template, hours) => {
-    const templateConfig = ROUTE_TEMPLATES[template];
-    const radiusKm = hours * 25 * (templateConfig?.scenic_factor || 1.0);
-    const numPoints = Math.floor(8 * (templateConfig?.waypoint_factor || 1.0));
+    // Deferred until running touches/animations finish so the UI stays responsive
+    InteractionManager.runAfterInteractions(async () => {
+      try {
+        const { lons, lats } = generateCoordinatesFromTemplate(
+          startLocation,
+          selectedTemplate,
+          duration
+        );
 
-    const coordinates = [[start.longitude, start.latitude]];
-    
-    for (let i = 0; i < numPoints; i++) {
-      const angle = (2 * Math.PI * i) / numPoints;
-      const radiusVariation = radiusKm * (0.7 + 0.6 * Math.sin(angle * 2));
-      
-      const dx = radiusVariation * Math.cos(angle);
-      const dy = radiusVariation * Math.sin(angle);
-      
-      const latOffset = start.latitude + (dy / 111);
-      const lonOffset = start.longitude + (dx / (111 * Math.cos(start.latitude * Math.PI / 180)));
-      
-      coordinates.push([lonOffset, latOffset]);
-    }
-    
-    coordinates.push([start.longitude, start.latitude]); // Close loop
-    return coordinates;
-  };
+        const response = await fetch('https://api.openrouteservice.org/v2/directions/driving-car/gpx', {
+          method: 'POST',
+          headers: {
+            'Authorization': 'YOUR_API_KEY', // Store securely
+            'Content-Type': 'application/json'
+          },
+          body: buildDirectionsBody(lons, lats)
+        });
 
-  // Parse GPX to coordinates for map display
-  const parseGPXToCoordinates = (gpxText) => {
-    // Simple GPX parsing - in production use a proper XML parser
-    const coords = [];
-    const regex = /<trkpt lat="([^"]+)" lon="([^"]+)">/g;
-    let match;
-    
-    while ((match = regex.exec(gpxText)) !== null) {
-      coords.push({
-        latitude: parseFloat(match[1]),
-        longitude: parseFloat(match[2])
-      });
-    }
-    
-    return coords;
+        const gpxData = await response.text();
+
+        // Generate and save GPX file; the native write proceeds while the
+        // trackpoints are parsed for the map
+        const saved = saveGPXFile(gpxData);
+        setRouteCoordinates(parseGPXToCoordinates(gpxData));
+        await saved;
+      
+        Alert.alert("Success", "BMW GPX route generated and saved!");
+      } catch (error) {
+        Alert.alert("Error", "Failed to generate route: " + error.message);
+      } finally {
+        inFlight.current = false;
+        setIsGenerating(false);
+      }
+    });
   };
 
   // Save GPX file with BMW metadata
   const saveGPXFile = async (gpxContent) => {
-    const enhancedGPX = addBMWMetadata(gpxContent);
-    const fileName = `${rideName.replace(' ', '_')}.gpx`;
+    const fileName = `${rideName.replace(UNSAFE_FILENAME_RE, '_')}.gpx`;
     const fileUri = FileSystem.documentDirectory + fileName;
     
-    await FileSystem.writeAsStringAsync(fileUri, enhancedGPX);
+    const [, canShare] = await Promise.all([
+      FileSystem.writeAsStringAsync(
+        fileUri,
+        addBMWMetadata(gpxContent, metadataFragment)
+      ),
+      Sharing.isAvailableAsync()
+    ]);
     
     // Share file (can be imported to BMW apps)
-    if (await Sharing.isAvailableAsync()) {
+    if (canShare) {
       await Sharing.shareAsync(fileUri);
     }
   };
 
-  // Add BMW-specific metadata to GPX
-  const addBMWMetadata = (gpxContent) => {
-    // Add BMW metadata similar to your Streamlit function
-    const metadata = `
-    <metadata>
-      <name>${rideName}</name>
-      <desc>BMW Motorrad route for ${selectedBike}</desc>
-      <extensions>
-        <bmw>
-          <bike_model>${selectedBike}</bike_model>
-          <emergency_contact>${emergencyContact}</emergency_contact>
-          <emergency_phone>${emergencyPhone}</emergency_phone>
-        </bmw>
-      </extensions>
-    </metadata>`;
-    
-    return gpxContent.replace('<metadata>', metadata);
-  };
-
   return (
     <ScrollView style={styles.container}>
       {/* Header */}
@@ -175,59 +529,50 @@ const BMWGPXApp = () => {
       {/* BMW Bike Selection */}
       <View style={styles.section}>
         <Text style={styles.sectionTitle}>🏍️ Your BMW Motorrad</Text>
-        <Picker
-          selectedValue={selectedBike}
-          onValueChange={setSelectedBike}
-          style={styles.picker}
+        <TouchableOpacity style={styles.picker} onPress={openBikeList}>
+          <Text style={styles.pickerText}>{selectedBike}</Text>
+        </TouchableOpacity>
+        <Modal
+          visible={bikeListVisible}
+          animationType="slide"
+          transparent
+          onRequestClose={closeBikeList}
         >
-          {Object.keys(BMW_BIKES).map(bike => (
-            <Picker.Item key={bike} label={bike} value={bike} />
-          ))}
-        </Picker>
+          <View style={styles.bikeListBackdrop}>
+            <View style={styles.bikeList}>
+              <FlatList
+                data={BIKE_NAMES}
+                keyExtractor={bikeKey}
+                getItemLayout={bikeItemLayout}
+                initialNumToRender={10}
+                windowSize={5}
+                renderItem={renderBikeRow}
+              />
+              <TouchableOpacity style={styles.bikeListClose} onPress={closeBikeList}>
+                <Text style={styles.bikeListCloseText}>Cancel</Text>
+              </TouchableOpacity>
+            </View>
+          </View>
+        </Modal>
       </View>
 
       {/* Route Templates */}
       <View style={styles.section}>
         <Text style={styles.sectionTitle}>🗺️ Route Template</Text>
-        <View style={styles.templateGrid}>
-          {Object.entries(ROUTE_TEMPLATES).map(([name, config]) => (
-            <TouchableOpacity
-              key={name}
-              style={[
-                styles.templateButton,
-                selectedTemplate === name && styles.selectedTemplate
-              ]}
-              onPress={() => setSelectedTemplate(name)}
-            >
-              <Text style={styles.templateName}>{name}</Text>
-              <Text style={styles.templateDesc}>{config.description}</Text>
-            </TouchableOpacity>
-          ))}
-        </View>
+        <TemplateGrid
+          selectedTemplate={selectedTemplate}
+          onSelect={selectTemplate}
+        />
       </View>
 
       {/* Map */}
       <View style={styles.section}>
         <Text style={styles.sectionTitle}>📍 Route Map</Text>
-        <MapView
-          style={styles.map}
-          region={{
-            latitude: startLocation.latitude,
-            longitude: startLocation.longitude,
-            latitudeDelta: 0.5,
-            longitudeDelta: 0.5,
-          }}
-          onPress={(e) => setStartLocation(e.nativeEvent.coordinate)}
-        >
-          <Marker coordinate={startLocation} title="Start/Finish" />
-          {routeCoordinates.length > 0 && (
-            <Polyline
-              coordinates={routeCoordinates}
-              strokeColor="#0066CC"
-              strokeWidth={4}
-            />
-          )}
-        </MapView>
+        <RouteMap
+          startLocation={startLocation}
+          routeCoordinates={routeCoordinates}
+          onPress={onMapPress}
+        />
       </View>
 
       {/* Route Settings */}
@@ -278,8 +623,16 @@ const BMWGPXApp = () => {
       </View>
 
       {/* Generate Button */}
-      <TouchableOpacity style={styles.generateButton} onPress={generateRoute}>
-        <Text style={styles.generateButtonText}>🏍️ Generate BMW Route</Text>
+      <TouchableOpacity
+        style={[styles.generateButton, isGenerating && styles.generateButtonDisabled]}
+        onPress={generateRoute}
+        disabled={isGenerating}
+      >
+        {isGenerating ? (
+          <ActivityIndicator color="white" />
+        ) : (
+          <Text style={styles.generateButtonText}>🏍️ Generate BMW Route</Text>
+        )}
       </TouchableOpacity>
 
       {/* BMW Integration Info */}
@@ -336,6 +689,44 @@ const styles = StyleSheet.create({
   picker: {
     backgroundColor: '#f0f0f0',
     borderRadius: 5,
+    padding: 12,
+  },
+  pickerText: {
+    fontSize: 16,
+  },
+  bikeListBackdrop: {
+    flex: 1,
+    justifyContent: 'flex-end',
+    backgroundColor: 'rgba(0, 0, 0, 0.3)',
+  },
+  bikeList: {
+    maxHeight: '60%',
+    backgroundColor: 'white',
+    borderTopLeftRadius: 10,
+    borderTopRightRadius: 10,
+    paddingBottom: 30,
+  },
+  bikeRow: {
+    height: BIKE_ROW_HEIGHT,
+    justifyContent: 'center',
+    paddingHorizontal: 15,
+    borderBottomWidth: 1,
+    borderBottomColor: '#eee',
+  },
+  selectedBikeRow: {
+    backgroundColor: '#e6f3ff',
+  },
+  bikeRowText: {
+    fontSize: 16,
+  },
+  bikeListClose: {
+    padding: 15,
+    alignItems: 'center',
+  },
+  bikeListCloseText: {
+    color: '#0066CC',
+    fontSize: 16,
+    fontWeight: 'bold',
   },
   templateGrid: {
     flexDirection: 'row',
@@ -392,6 +783,9 @@ const styles = StyleSheet.create({
     borderRadius: 10,
     alignItems: 'center',
   },
+  generateButtonDisabled: {
+    opacity: 0.6,
+  },
   generateButtonText: {
     color: 'white',
     fontSize: 18,